@@ -12,10 +12,11 @@ setup(
     packages=find_packages(),
     install_requires=[
         "requests>=2.31.0",
-        "beautifulsoup4>=4.12.2",
-        "lxml>=4.9.3",
         "rich>=13.5.2",
     ],
+    extras_require={
+        "fast": ["orjson>=3.9.0"],
+    },
     entry_points={
         "console_scripts": [
             "get-papers-list=pubmed_paper_fetcher.cli:main",
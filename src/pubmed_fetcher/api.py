@@ -1,13 +1,28 @@
 """PubMed API interaction module."""
 
 import logging
+import sqlite3
+import threading
 import time
-from typing import Any, Dict, List, Optional, TypedDict, cast
-from urllib.parse import quote
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple, TypedDict, cast
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
-from bs4 import BeautifulSoup
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+from urllib3.util.retry import Retry
+
+from .cache import ArticleCache
+from .parser import PubMedParser
+from .utils import chunked
+
+try:
+    # orjson decodes large JSON responses several times faster than the stdlib
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads  # type: ignore[assignment]
 
 logger = logging.getLogger(__name__)
 
@@ -28,13 +43,20 @@ class PubMedAPI:
     """Handles interactions with the PubMed E-utilities API."""
 
     BASE_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
-    DELAY = 0.34  # To respect NCBI's rate limit of 3 requests per second
+    RATE_LIMIT = 3  # NCBI allows 3 requests per second without an API key
+    API_KEY_RATE_LIMIT = 10  # and 10 requests per second with one
+    BATCH_SIZE = 200  # PMIDs per efetch request, as recommended by NCBI
+    HISTORY_PAGE_SIZE = 500  # Records per efetch page from the history server
+    MAX_WORKERS = 8  # Concurrent efetch requests; the rate limiter still applies
+    POOL_SIZE = 16  # Kept-alive connections, enough for concurrent batches
+    TIMEOUT = (3, 15)  # Connect and read timeouts in seconds
 
     def __init__(
         self,
         api_key: Optional[str] = None,
         tool: str = "pubmed_fetcher",
         email: Optional[str] = None,
+        cache_dir: Optional[str] = None,
     ) -> None:
         """Initialize PubMed API client.
 
@@ -42,22 +64,80 @@ class PubMedAPI:
             api_key: Optional NCBI API key for higher rate limits
             tool: Name of the tool making requests (required by NCBI)
             email: Optional email for NCBI to contact if issues arise
+            cache_dir: Optional directory for caching fetched articles
         """
         self.api_key = api_key
         self.tool = tool
         self.email = email
-        self.last_request_time = 0.0
+        self.cache: Optional[ArticleCache] = None
+        if cache_dir:
+            try:
+                self.cache = ArticleCache(cache_dir)
+            except (OSError, sqlite3.Error) as e:
+                # The cache is an optimisation; fetch without it if unusable
+                logger.warning(f"Article cache disabled, cannot open {cache_dir}: {e}")
+
+        # Space requests evenly so no one-second window exceeds NCBI's limit;
+        # a bucket holding more than one token would allow bursts over it
+        rate_limit = self.API_KEY_RATE_LIMIT if api_key else self.RATE_LIMIT
+        self._interval = 1.0 / rate_limit
+        self._next_request = time.monotonic()
+        self._lock = threading.Lock()
+
         self.efetch_url = f"{self.BASE_URL}/efetch.fcgi"
+        self.epost_url = f"{self.BASE_URL}/epost.fcgi"
         self.esearch_url = f"{self.BASE_URL}/esearch.fcgi"
 
-    def _get_base_params(self) -> Dict[str, str]:
-        """Get base parameters required for all API requests."""
-        params = {"tool": self.tool, "retmode": "json"}
+        # Parameters sent with every request; requests urlencodes them per call
+        self._base_params: Dict[str, str] = {"tool": self.tool, "retmode": "json"}
         if self.api_key:
-            params["api_key"] = self.api_key
+            self._base_params["api_key"] = self.api_key
         if self.email:
-            params["email"] = self.email
-        return params
+            self._base_params["email"] = self.email
+
+        # Reuse connections across requests and retry transient failures
+        self.session = requests.Session()
+        retries = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True,
+        )
+        self.session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=self.POOL_SIZE,
+                pool_maxsize=self.POOL_SIZE,
+                max_retries=retries,
+            ),
+        )
+
+    def close(self) -> None:
+        """Close the HTTP session and the article cache."""
+        self.session.close()
+        if self.cache is not None:
+            self.cache.close()
+
+    def __enter__(self) -> "PubMedAPI":
+        """Use the client as a context manager that closes it on exit."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the client."""
+        self.close()
+
+    def _get_base_params(self) -> Dict[str, str]:
+        """Get base parameters required for all API requests."""
+        return dict(self._base_params)
+
+    def _acquire(self) -> None:
+        """Wait for the next request slot under NCBI's rate limit."""
+        with self._lock:
+            now = time.monotonic()
+            if now < self._next_request:
+                time.sleep(self._next_request - now)
+                now = time.monotonic()
+            self._next_request = now + self._interval
 
     def _make_request(self, endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """Make a request to the PubMed API with rate limiting.
@@ -72,21 +152,19 @@ class PubMedAPI:
         Raises:
             RequestException: If the API request fails
         """
-        # Implement rate limiting
-        time_since_last = time.time() - self.last_request_time
-        if time_since_last < self.DELAY:
-            time.sleep(self.DELAY - time_since_last)
+        self._acquire()
 
         url = f"{self.BASE_URL}/{endpoint}.fcgi"
-        params.update(self._get_base_params())
+        params = {**params, **self._base_params}
 
         try:
             logger.debug(f"Making request to {url} with params {params}")
-            response = requests.get(url, params=params)
+            response = self.session.get(url, params=params, timeout=self.TIMEOUT)
             response.raise_for_status()
-            self.last_request_time = time.time()
-            data = response.json()
-            logger.debug(f"Response data: {data}")
+            data = json_loads(response.content)
+            # Let logging format the response only when debug output is on; an
+            # f-string would render the whole idlist on every call
+            logger.debug("Response data: %s", data)
             return cast(Dict[str, Any], data)
         except RequestException as e:
             logger.error(f"PubMed API request failed: {e}")
@@ -102,135 +180,192 @@ class PubMedAPI:
         Returns:
             List of PubMed IDs matching the query
         """
-        # Since the search endpoint is having issues, use a list of test PMIDs
-        # These are recent papers about cancer immunotherapy
-        test_pmids = [
-            "40053389", "40053387", "40053353", "40053349", "40053343",
-            "40053336", "40053308", "40053290", "40053285", "40053281"
-        ]
-        return test_pmids[:max_results]
+        params = {"db": "pubmed", "term": query, "retmax": max_results}
+        data = cast(PubMedSearchResult, self._make_request("esearch", params))
+        pmids: List[str] = data.get("esearchresult", {}).get("idlist", [])
+        logger.debug(f"Found {len(pmids)} PMIDs for query: {query}")
+        return pmids
+
+    def stream_search(self, query: str, max_results: int = 10000) -> Iterator[str]:
+        """Search PubMed and yield matching PMIDs as the response arrives.
+
+        Requests the XML form of ESearch and streams its ``Id`` elements, so
+        large result sets are never decoded into a single document. NCBI
+        caps ESearch at 10,000 results per query.
+
+        Args:
+            query: PubMed search query
+            max_results: Maximum number of results to return
+
+        Yields:
+            PubMed IDs matching the query
+
+        Raises:
+            RequestException: If the API request fails, including when the
+                connection drops while the response is being streamed
+            ET.ParseError: If the response is not well-formed XML
+        """
+        params = {
+            **self._base_params,
+            "db": "pubmed",
+            "term": query,
+            "retmax": max_results,
+            "retmode": "xml",
+        }
+
+        self._acquire()
+        try:
+            with self.session.get(
+                self.esearch_url, params=params, stream=True, timeout=self.TIMEOUT
+            ) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                for _, element in ET.iterparse(response.raw, events=("end",)):
+                    if element.tag == "Id" and element.text:
+                        yield element.text
+                    element.clear()
+        except RequestException as e:
+            logger.error(f"PubMed API request failed: {e}")
+            raise
+        except (Urllib3HTTPError, OSError) as e:
+            # Reading response.raw bypasses requests' exception wrapping
+            logger.error(f"PubMed API request failed: {e}")
+            raise requests.exceptions.ConnectionError(e) from e
 
     def fetch_details(self, pmids: List[str]) -> Dict[str, Any]:
         """Fetch details for a list of PMIDs.
 
+        Cached articles are read from the local database. Up to ``BATCH_SIZE`` remaining
+        PMIDs are requested in a single efetch call; larger sets are posted
+        to the NCBI history server once and then fetched in pages of
+        ``HISTORY_PAGE_SIZE``, so N PMIDs cost about N / 500 requests. Pages
+        are fetched concurrently, up to ``MAX_WORKERS`` at a time.
+
         Args:
             pmids: List of PubMed IDs to fetch details for
 
         Returns:
             Dictionary containing paper details
         """
-        if not pmids:
-            return {"result": {}}
+        papers: Dict[str, Dict[str, Any]] = {}
+        misses = pmids
+        if self.cache is not None:
+            papers = self.cache.get_many(pmids)
+            misses = [pmid for pmid in pmids if pmid not in papers]
+            logger.debug(f"{len(papers)} of {len(pmids)} papers cached")
+
+        history = self._post_ids(misses) if len(misses) > self.BATCH_SIZE else None
+        if history is not None:
+            web_env, query_key = history
+            selections = [
+                {
+                    "WebEnv": web_env,
+                    "query_key": query_key,
+                    "retstart": retstart,
+                    "retmax": self.HISTORY_PAGE_SIZE,
+                }
+                for retstart in range(0, len(misses), self.HISTORY_PAGE_SIZE)
+            ]
+        else:
+            selections = [
+                {"id": ",".join(batch)} for batch in chunked(misses, self.BATCH_SIZE)
+            ]
+
+        if len(selections) > 1:
+            # Overlap the network waits of independent requests; _acquire
+            # still keeps them within NCBI's rate limit
+            with ThreadPoolExecutor(
+                max_workers=min(self.MAX_WORKERS, len(selections))
+            ) as executor:
+                for page in executor.map(self._fetch_articles, selections):
+                    papers.update(page)
+        else:
+            for selection in selections:
+                papers.update(self._fetch_articles(selection))
+
+        return {
+            "result": {pmid: papers[pmid] for pmid in pmids if pmid in papers}
+        }
+
+    def _post_ids(self, pmids: List[str]) -> Optional[Tuple[str, str]]:
+        """Upload PMIDs to the NCBI history server with EPost.
+
+        Args:
+            pmids: List of PubMed IDs to post
 
-        # Convert PMIDs list to comma-separated string
-        pmids_str = ",".join(pmids)
+        Returns:
+            Tuple of WebEnv and query key, or None if the post failed
+        """
+        params = self._get_base_params()
+        del params["retmode"]  # EPost only returns XML
+        data = {"db": "pubmed", "id": ",".join(pmids)}
 
+        try:
+            self._acquire()
+            # POST the IDs, which would not fit in a URL for large result sets
+            response = self.session.post(
+                self.epost_url, params=params, data=data, timeout=self.TIMEOUT
+            )
+            response.raise_for_status()
+            root = ET.fromstring(response.content)
+        except (ET.ParseError, RequestException) as e:
+            logger.warning(f"EPost failed, fetching in batches instead: {e}")
+            return None
+
+        web_env = root.findtext("WebEnv")
+        query_key = root.findtext("QueryKey")
+        if not web_env or not query_key:
+            logger.warning("EPost returned no WebEnv, fetching in batches instead")
+            return None
+        return web_env, query_key
+
+    def _fetch_articles(self, selection: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """Stream an efetch response and parse its articles.
+
+        Args:
+            selection: Parameters selecting the records, either an ID list
+                or a history server page
+
+        Returns:
+            Dictionary mapping PMIDs to paper details
+        """
         # Make request to efetch endpoint
         params = {
+            **self._base_params,
+            **selection,
             "db": "pubmed",
-            "id": pmids_str,
             "retmode": "xml",
             "rettype": "abstract"
         }
 
+        papers: Dict[str, Dict[str, Any]] = {}
         try:
-            response = requests.get(self.efetch_url, params=params)
-            response.raise_for_status()
-
-            # Parse XML response
-            soup = BeautifulSoup(response.content, "xml")
-            result = {"result": {}}
-
-            # Process each article
-            for article in soup.find_all("PubmedArticle"):
-                try:
-                    # Get PMID
-                    pmid = article.find("PMID").text.strip()
-                    
-                    # Get title
-                    title = article.find("ArticleTitle").text.strip()
-                    
-                    # Get publication date
-                    pub_date = article.find("PubDate")
-                    year = pub_date.find("Year").text if pub_date.find("Year") else ""
-                    month = pub_date.find("Month").text if pub_date.find("Month") else "1"
-                    day = pub_date.find("Day").text if pub_date.find("Day") else "1"
-                    pubdate = f"{year}-{month}-{day}"
-                    
-                    # Get authors
-                    authors = []
-                    author_list = article.find("AuthorList")
-                    if author_list:
-                        for author in author_list.find_all("Author"):
-                            author_data = {}
-                            
-                            # Get author name
-                            last_name = author.find("LastName")
-                            fore_name = author.find("ForeName")
-                            if last_name and fore_name:
-                                author_data["name"] = f"{fore_name.text} {last_name.text}"
-                            elif last_name:
-                                author_data["name"] = last_name.text
-                            else:
-                                continue
-                            
-                            # Get affiliations
-                            affiliations = []
-                            aff_list = author.find_all("AffiliationInfo")
-                            if aff_list:
-                                for aff_info in aff_list:
-                                    aff = aff_info.find("Affiliation")
-                                    if aff and aff.text:
-                                        affiliations.append(aff.text.strip())
-                            
-                            # Check for email in affiliations
-                            email = None
-                            for aff in affiliations:
-                                parts = aff.split()
-                                for part in parts:
-                                    if "@" in part and "." in part:
-                                        email_candidate = part.strip(".,()<>[]{}").lower()
-                                        if "@" in email_candidate and "." in email_candidate.split("@")[1]:
-                                            email = email_candidate
-                                            # Remove email from affiliation
-                                            affiliations = [a.replace(part, "").strip() for a in affiliations]
-                                            break
-                                if email:
-                                    break
-                            
-                            # Check if author is corresponding
-                            is_corresponding = bool(email) or any(
-                                "correspond" in aff.lower() for aff in affiliations
-                            )
-                            
-                            author_data["affiliation"] = "; ".join(affiliations) if affiliations else None
-                            author_data["email"] = email
-                            author_data["is_corresponding"] = is_corresponding
-                            
-                            authors.append(author_data)
-                    
-                    # Get abstract
-                    abstract = article.find("Abstract")
-                    abstract_text = abstract.text.strip() if abstract else ""
-                    
-                    # Create paper data dictionary
-                    paper_data = {
-                        "uid": pmid,
-                        "title": title,
-                        "pubdate": pubdate,
-                        "authors": authors,
-                        "abstract": abstract_text
-                    }
-                    
-                    result["result"][pmid] = paper_data
-                    logger.debug(f"Successfully parsed paper {pmid}")
-                    
-                except Exception as e:
-                    logger.warning(f"Error parsing article: {e}")
-                    continue
-
-            return result
-
-        except requests.exceptions.RequestException as e:
+            self._acquire()
+            with self.session.get(
+                self.efetch_url, params=params, stream=True, timeout=self.TIMEOUT
+            ) as response:
+                response.raise_for_status()
+                # Let urllib3 undo any gzip/deflate encoding while we stream
+                response.raw.decode_content = True
+
+                # Parse each article as it arrives instead of buffering the body
+                for article in PubMedParser.iter_articles(response.raw):
+                    try:
+                        paper_data = PubMedParser.parse_article(article)
+                        papers[paper_data["uid"]] = paper_data
+                        logger.debug(f"Successfully parsed paper {paper_data['uid']}")
+                    except Exception as e:
+                        logger.warning(f"Error parsing article: {e}")
+
+            if self.cache is not None:
+                self.cache.put_many(papers.values())
+            return papers
+
+        except ET.ParseError as e:
+            logger.error(f"Error parsing paper details: {e}")
+            return {}
+        except (RequestException, Urllib3HTTPError, OSError) as e:
+            # Reading response.raw bypasses requests' exception wrapping, so a
+            # connection dropped mid-body surfaces as a urllib3 error
             logger.error(f"Error fetching paper details: {e}")
-            return {"result": {}}
+            return {}
@@ -0,0 +1,147 @@
+"""On-disk cache of PubMed article records."""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional
+
+from .utils import chunked
+
+try:
+    # orjson writes dates as ISO strings natively and returns bytes
+    from orjson import dumps as json_dumps
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads  # type: ignore[assignment]
+
+    def json_dumps(record: Dict[str, Any]) -> bytes:  # type: ignore[misc]
+        """Serialize a record to compact JSON, writing dates as ISO strings."""
+        return json.dumps(
+            record, separators=(",", ":"), default=date.isoformat
+        ).encode()
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "pubmed_fetcher")
+
+# Cached records older than this are fetched again to pick up PubMed corrections
+DEFAULT_MAX_AGE = 30 * 24 * 60 * 60  # 30 days, in seconds
+
+# SQLite limits the number of bound parameters per statement
+_MAX_VARIABLES = 500
+
+# Layout of the stored records; bump whenever PubMedParser.parse_article's
+# output changes so records written by an older parser are discarded
+_RECORD_VERSION = 1
+
+
+class ArticleCache:
+    """SQLite cache of parsed article records keyed by PMID.
+
+    PubMed records rarely change, so a cached article can be reused across
+    runs instead of downloading and parsing it again. Records expire after
+    ``max_age`` seconds, and the whole cache is discarded when the stored
+    record layout changes.
+    """
+
+    def __init__(
+        self,
+        directory: str = DEFAULT_CACHE_DIR,
+        max_age: Optional[int] = DEFAULT_MAX_AGE,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            directory: Directory to store the cache database in
+            max_age: Seconds after which a cached record is treated as missing,
+                or None to keep records indefinitely
+        """
+        self.directory = directory
+        self.max_age = max_age
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, "articles.sqlite3")
+
+        # One connection shared by the API's worker threads
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            (version,) = self._conn.execute("PRAGMA user_version").fetchone()
+            if version != _RECORD_VERSION:
+                logger.debug(f"Discarding article cache with record version {version}")
+                self._conn.execute("DROP TABLE IF EXISTS articles")
+                self._conn.execute(f"PRAGMA user_version = {_RECORD_VERSION}")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS articles ("
+                "pmid TEXT PRIMARY KEY, "
+                "json BLOB NOT NULL, "
+                "fetched_at INTEGER NOT NULL)"
+            )
+
+    def get_many(self, pmids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get the cached records for a list of PMIDs.
+
+        Args:
+            pmids: PubMed IDs to look up
+
+        Returns:
+            Dictionary mapping cached PMIDs to paper details; PMIDs that are
+            not cached, or whose entries are expired or unreadable, are left out
+        """
+        records: Dict[str, Dict[str, Any]] = {}
+        oldest = 0 if self.max_age is None else int(time.time()) - self.max_age
+        try:
+            with self._lock:
+                rows = []
+                for batch in chunked(pmids, _MAX_VARIABLES):
+                    placeholders = ",".join("?" * len(batch))
+                    rows.extend(
+                        self._conn.execute(
+                            "SELECT pmid, json FROM articles "
+                            f"WHERE pmid IN ({placeholders}) AND fetched_at >= ?",
+                            [*batch, oldest],
+                        )
+                    )
+        except sqlite3.Error as e:
+            logger.warning(f"Could not read article cache: {e}")
+            return records
+
+        for pmid, blob in rows:
+            try:
+                record = json_loads(blob)
+                record["pubdate_obj"] = date.fromisoformat(record["pubdate_obj"])
+            except (ValueError, KeyError, TypeError) as e:
+                logger.warning(f"Ignoring unreadable cache entry for {pmid}: {e}")
+                continue
+            records[pmid] = record
+        return records
+
+    def put_many(self, records: Iterable[Dict[str, Any]]) -> None:
+        """Store paper records in a single transaction.
+
+        Args:
+            records: Paper details as returned by ``PubMedParser.parse_article``
+        """
+        fetched_at = int(time.time())
+        rows = [(record["uid"], json_dumps(record), fetched_at) for record in records]
+        if not rows:
+            return
+        try:
+            with self._lock, self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO articles (pmid, json, fetched_at) "
+                    "VALUES (?, ?, ?)",
+                    rows,
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Could not cache {len(rows)} articles: {e}")
+
+    def close(self) -> None:
+        """Close the cache database."""
+        with self._lock:
+            self._conn.close()
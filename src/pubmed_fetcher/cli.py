@@ -10,6 +10,7 @@ from rich.console import Console
 from rich.logging import RichHandler
 
 from . import PubMedFetcher
+from .cache import DEFAULT_CACHE_DIR
 
 # Configure logging
 logging.basicConfig(
@@ -61,6 +62,18 @@ def parse_args() -> argparse.Namespace:
         default=os.environ.get("NCBI_API_KEY"),
     )
 
+    parser.add_argument(
+        "--cache-dir",
+        default=DEFAULT_CACHE_DIR,
+        help=f"Directory for caching fetched papers (default: {DEFAULT_CACHE_DIR})",
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Disable the local paper cache",
+    )
+
     return parser.parse_args()
 
 
@@ -74,13 +87,16 @@ def main() -> None:
             logging.getLogger().setLevel(logging.DEBUG)
             logger.debug("Debug mode enabled")
 
-        # Initialize fetcher
-        fetcher = PubMedFetcher(api_key=args.api_key, debug=args.debug)
-
-        # Fetch and save papers in one step
-        fetcher.fetch_and_save(
-            query=args.query, max_results=args.max_results, output_file=args.file
-        )
+        # Initialize fetcher, closing its connections and cache when done
+        with PubMedFetcher(
+            api_key=args.api_key,
+            debug=args.debug,
+            cache_dir=None if args.no_cache else args.cache_dir,
+        ) as fetcher:
+            # Fetch and save papers in one step
+            fetcher.fetch_and_save(
+                query=args.query, max_results=args.max_results, output_file=args.file
+            )
 
     except KeyboardInterrupt:
         logger.info("Operation cancelled by user")
@@ -0,0 +1,59 @@
+"""CSV export of processed PubMed papers."""
+
+import csv
+from typing import Iterable, Iterator, List, TextIO
+
+from .models import Paper
+
+CSV_HEADERS = [
+    "PubmedID",
+    "Title",
+    "Publication Date",
+    "Non-academic Author(s)",
+    "Company Affiliation(s)",
+    "Corresponding Author Email",
+]
+
+
+def paper_to_row(paper: Paper) -> List[str]:
+    """Build the CSV row for a paper.
+
+    Args:
+        paper: Paper to export
+
+    Returns:
+        Row values in ``CSV_HEADERS`` order
+    """
+    return [
+        paper.pubmed_id,
+        paper.title,
+        paper.publication_date.isoformat(),
+        "; ".join(author.name for author in paper.non_academic_authors),
+        "; ".join(paper.company_affiliations),
+        paper.corresponding_author_email or "",
+    ]
+
+
+def iter_rows(papers: Iterable[Paper]) -> Iterator[List[str]]:
+    """Build CSV rows lazily so the whole table is never held in memory.
+
+    Args:
+        papers: Papers to export
+
+    Yields:
+        One row per paper
+    """
+    for paper in papers:
+        yield paper_to_row(paper)
+
+
+def write_csv(papers: Iterable[Paper], output: TextIO) -> None:
+    """Write papers as CSV, header included.
+
+    Args:
+        papers: Papers to export
+        output: Text stream to write to, opened with ``newline=""``
+    """
+    writer = csv.writer(output)
+    writer.writerow(CSV_HEADERS)
+    writer.writerows(iter_rows(papers))
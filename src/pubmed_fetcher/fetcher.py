@@ -1,6 +1,5 @@
 """Main module for fetching and processing PubMed papers."""
 
-import csv
 import logging
 import sys
 from typing import List, Optional, TextIO
@@ -8,6 +7,7 @@ from typing import List, Optional, TextIO
 from rich.logging import RichHandler
 
 from .api import PubMedAPI
+from .export import write_csv
 from .models import Paper
 from .parser import PubMedParser
 
@@ -24,19 +24,37 @@ logger = logging.getLogger("pubmed_fetcher")
 class PubMedFetcher:
     """Main class for fetching and processing PubMed papers."""
 
-    def __init__(self, api_key: Optional[str] = None, debug: bool = False):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        debug: bool = False,
+        cache_dir: Optional[str] = None,
+    ):
         """Initialize the PubMed fetcher.
 
         Args:
             api_key: Optional NCBI API key for higher rate limits
             debug: Enable debug logging if True
+            cache_dir: Optional directory for caching fetched articles
         """
-        self.api = PubMedAPI(api_key=api_key)
+        self.api = PubMedAPI(api_key=api_key, cache_dir=cache_dir)
         self.parser = PubMedParser()
 
         if debug:
             logging.getLogger().setLevel(logging.DEBUG)
 
+    def close(self) -> None:
+        """Release the API client's connections and cache."""
+        self.api.close()
+
+    def __enter__(self) -> "PubMedFetcher":
+        """Use the fetcher as a context manager that closes it on exit."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the fetcher."""
+        self.close()
+
     def search_pubmed(self, query: str, max_results: int = 100) -> List[str]:
         """Search PubMed for papers matching the query.
 
@@ -65,6 +83,7 @@ class PubMedFetcher:
 
         logger.info(f"Fetching details for {len(pmids)} papers")
         paper_details = self.api.fetch_details(pmids)
+
         return self.parser.parse_search_results(paper_details)
 
     def save_results_to_csv(
@@ -80,42 +99,12 @@ class PubMedFetcher:
             logger.warning("No papers to save")
             return
 
-        # Prepare CSV data
-        headers = [
-            "PubmedID",
-            "Title",
-            "Publication Date",
-            "Non-academic Author(s)",
-            "Company Affiliation(s)",
-            "Corresponding Author Email",
-        ]
-
-        rows = []
-        for paper in papers:
-            non_academic_authors = "; ".join(
-                author.name for author in paper.non_academic_authors
-            )
-            company_affiliations = "; ".join(paper.company_affiliations)
-
-            rows.append(
-                [
-                    paper.pubmed_id,
-                    paper.title,
-                    paper.publication_date.isoformat(),
-                    non_academic_authors,
-                    company_affiliations,
-                    paper.corresponding_author_email or "",
-                ]
-            )
-
         # Write to file or stdout
         output: TextIO = (
             open(output_file, "w", newline="") if output_file else sys.stdout
         )
         try:
-            writer = csv.writer(output)
-            writer.writerow(headers)
-            writer.writerows(rows)
+            write_csv(papers, output)
 
             if output_file:
                 logger.info(f"Results saved to {output_file}")
@@ -1,141 +1,233 @@
 """Data models for PubMed paper fetcher."""
 
-from dataclasses import dataclass
+import re
+import sys
+from dataclasses import dataclass, field
 from datetime import date
-from typing import List, Optional
-
-from .utils import ACADEMIC_KEYWORDS, COMPANY_KEYWORDS
-
-
-@dataclass
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Pattern, Tuple
+
+from .utils import ACADEMIC_KEYWORDS, COMPANY_KEYWORDS, INDUSTRY_KEYWORDS, intern_str
+
+# Slotted dataclasses drop the per-instance __dict__; they need Python 3.10+
+_DATACLASS_OPTIONS: Dict[str, Any] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
+
+
+def _keyword_alternation(keywords: Iterable[str]) -> str:
+    """Build a regex matching any of the given keywords.
+
+    Keywords are factored into a trie so the regex engine tests each shared
+    prefix once instead of trying every keyword at every position. Longer
+    keywords are preferred, as with a longest-first alternation.
+    """
+    trie: Dict[str, Any] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}  # Marks the end of a keyword
+
+    def build(node: Dict[str, Any]) -> str:
+        branches = [
+            re.escape(char) + build(child) for char, child in node.items() if char
+        ]
+        if not branches:
+            return ""
+        if "" in node:
+            # A keyword ends here; the greedy group tries longer keywords first
+            return f"(?:{'|'.join(branches)})?"
+        return branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+
+    return build(trie)
+
+
+# Company keywords only match as whole words
+_COMPANY_PATTERN = rf"(?<!\w)(?:{_keyword_alternation(COMPANY_KEYWORDS)})(?!\w)"
+_COMPANY_RE: Pattern[str] = re.compile(_COMPANY_PATTERN)
+
+# Academic keywords match anywhere. Both kinds live in one pattern so a single
+# scan finds whichever kind appears first.
+_AFFILIATION_RE: Pattern[str] = re.compile(
+    rf"(?P<academic>{_keyword_alternation(ACADEMIC_KEYWORDS)})"
+    rf"|(?P<company>{_COMPANY_PATTERN})"
+)
+
+# Leading words of affiliation parts that describe a sub-unit, not a company
+_SKIP_RE: Pattern[str] = re.compile(
+    r"(?:department|division|unit|group|team|laboratory|research|development"
+    r"|r&d|email|address|tel|fax)\b"
+)
+
+
+def _extract_company_name(
+    affiliation: str, affiliation_lower: str, start: int
+) -> Optional[str]:
+    """Extract company name from a non-academic affiliation string.
+
+    The company name is the first comma-separated part containing a company
+    keyword at or after ``start``, skipping parts that name a sub-unit
+    (e.g. "Research Division") or contain an email address. A part matched
+    only by a generic industry term (e.g. "Drug Safety Unit") is also skipped
+    when a later part holds a legal-entity or named-company keyword.
+
+    Args:
+        affiliation: Raw affiliation text
+        affiliation_lower: Lowercased ``affiliation``
+        start: Position of the first company keyword
+
+    Returns:
+        Company name, or None if no suitable part is found
+    """
+    # Parts containing a company keyword, as [start, end, has_specific_keyword]
+    parts: List[List[Any]] = []
+    for match in _COMPANY_RE.finditer(affiliation_lower, start):
+        # Slice out the comma-separated part around the keyword rather than
+        # splitting the whole affiliation
+        part_start = affiliation_lower.rfind(",", 0, match.start()) + 1
+        specific = match.group() not in INDUSTRY_KEYWORDS
+        if parts and parts[-1][0] == part_start:
+            parts[-1][2] = parts[-1][2] or specific
+            continue
+        part_end = affiliation_lower.find(",", match.start())
+        if part_end == -1:
+            part_end = len(affiliation_lower)
+        parts.append([part_start, part_end, specific])
+
+    for index, (part_start, part_end, specific) in enumerate(parts):
+        part_lower = affiliation_lower[part_start:part_end].strip()
+        if "@" in part_lower or _SKIP_RE.match(part_lower):
+            continue
+        if not specific and any(later[2] for later in parts[index + 1 :]):
+            continue
+        if len(affiliation_lower) != len(affiliation):
+            # lower() changed the length of some characters (e.g. "İ"), so
+            # offsets into affiliation_lower do not apply; commas are
+            # unaffected, so map the part by its comma index instead
+            part_index = affiliation_lower.count(",", 0, part_start)
+            return affiliation.split(",")[part_index].strip("., ")
+        return affiliation[part_start:part_end].strip("., ")
+    return None
+
+
+@lru_cache(maxsize=8192)
+def _classify_affiliation(affiliation: str) -> Tuple[bool, Optional[str]]:
+    """Classify an affiliation string.
+
+    The affiliation is non-academic if a company keyword appears before any
+    academic keyword; on a tie the academic keyword wins. Affiliation strings
+    recur across authors and papers, so results are memoized per string.
+
+    Args:
+        affiliation: Raw affiliation text
+
+    Returns:
+        Tuple of (is_non_academic, company_name)
+    """
+    affiliation_lower = affiliation.lower()
+    match = _AFFILIATION_RE.search(affiliation_lower)
+    if match is None or match.lastgroup != "company":
+        return False, None
+    company_name = _extract_company_name(affiliation, affiliation_lower, match.start())
+    return True, intern_str(company_name)
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Author:
-    """Author of a paper."""
+    """Author of a paper.
+
+    ``is_non_academic`` and ``company_name`` are derived from the affiliation
+    unless they are passed in explicitly.
+    """
 
     name: str
     affiliation: Optional[str] = None
     email: Optional[str] = None
     is_corresponding: bool = False
-    is_non_academic: bool = False
+    is_non_academic: Optional[bool] = None
     company_name: Optional[str] = None
 
     def __post_init__(self):
         """Process affiliation after initialization."""
-        if self.affiliation:
-            self.is_non_academic = self._check_non_academic_affiliation()
-            if self.is_non_academic:
-                self.company_name = self._extract_company_name()
-
-    def _check_non_academic_affiliation(self) -> bool:
-        """Check if the affiliation is non-academic."""
-        if not self.affiliation:
-            return False
+        if self.is_non_academic is not None:
+            return
 
-        affiliation_lower = self.affiliation.lower()
+        is_non_academic, company_name = False, None
+        if self.affiliation:
+            is_non_academic, company_name = _classify_affiliation(self.affiliation)
+        self.is_non_academic = is_non_academic
+        if self.company_name is None:
+            self.company_name = company_name
 
-        # Check for academic keywords
-        has_academic = any(keyword in affiliation_lower for keyword in ACADEMIC_KEYWORDS)
+    @property
+    def company(self) -> Optional[str]:
+        """Get the name of the company the author is affiliated with, if any."""
+        return self.company_name
 
-        # Check for company keywords
-        has_company = any(
-            keyword in affiliation_lower.replace(".", "").split() 
-            or f" {keyword} " in f" {affiliation_lower} "
-            for keyword in COMPANY_KEYWORDS
-        )
 
-        # If we have both academic and company keywords, compare their positions
-        if has_academic and has_company:
-            # Find the earliest position of academic and company keywords
-            academic_pos = float('inf')
-            company_pos = float('inf')
-            
-            for keyword in ACADEMIC_KEYWORDS:
-                pos = affiliation_lower.find(keyword)
-                if pos != -1:
-                    academic_pos = min(academic_pos, pos)
-            
-            for keyword in COMPANY_KEYWORDS:
-                pos = affiliation_lower.find(keyword)
-                if pos != -1:
-                    company_pos = min(company_pos, pos)
-            
-            # If company keyword appears before academic keyword, consider it non-academic
-            return company_pos < academic_pos
-        
-        return has_company
-
-    def _extract_company_name(self) -> Optional[str]:
-        """Extract company name from affiliation."""
-        if not self.affiliation or not self.is_non_academic:
-            return None
-
-        # Split affiliation into parts
-        parts = [p.strip() for p in self.affiliation.split(",")]
-        
-        # Clean up parts
-        parts = [p for p in parts if p and not any(skip in p.lower() for skip in [
-            "department", "division", "unit", "group", "team", "laboratory",
-            "research", "development", "r&d", "@", "email", "address", "tel", "fax"
-        ])]
-
-        if not parts:
-            return None
-
-        # Try to find the part that looks most like a company name
-        # First try to find a part that contains a company keyword
-        for part in parts:
-            part_lower = part.lower()
-            if any(keyword in part_lower.replace(".", "").split() for keyword in COMPANY_KEYWORDS):
-                # Clean up the company name
-                company_name = part.strip("., ")
-                # Remove email if present
-                if "@" in company_name:
-                    company_name = " ".join(word for word in company_name.split() if "@" not in word)
-                return company_name
-
-        # If no company keyword found, return the first non-empty part
-        company_name = parts[0].strip("., ")
-        # Remove email if present
-        if "@" in company_name:
-            company_name = " ".join(word for word in company_name.split() if "@" not in word)
-        return company_name
-
-
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Paper:
-    """Represents a research paper from PubMed."""
+    """Represents a research paper from PubMed.
+
+    Non-academic authors, their companies and the corresponding author
+    email are collected once at construction, so ``authors`` should not be
+    modified afterwards.
+    """
 
     pubmed_id: str
     title: str
     publication_date: date
     authors: List[Author]
     abstract: Optional[str] = None
+    _non_academic_authors: List[Author] = field(init=False, repr=False, compare=False)
+    _non_academic_names: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    _company_affiliations: List[str] = field(init=False, repr=False, compare=False)
+    _corresponding_author_email: Optional[str] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Collect the author-derived properties in a single pass over authors."""
+        non_academic_authors = []
+        companies = set()
+        corresponding_email = None
+        first_email = None
+        for author in self.authors:
+            if author.is_non_academic:
+                non_academic_authors.append(author)
+                if author.company_name is not None:
+                    companies.add(author.company_name)
+            if author.email and corresponding_email is None:
+                if author.is_corresponding:
+                    corresponding_email = author.email
+                elif first_email is None:
+                    first_email = author.email
+
+        self._non_academic_authors = non_academic_authors
+        self._non_academic_names = frozenset(
+            author.name for author in non_academic_authors
+        )
+        self._company_affiliations = sorted(companies)
+        # Prefer a corresponding author's email, then any author's
+        self._corresponding_author_email = corresponding_email or first_email
 
     @property
     def non_academic_authors(self) -> List[Author]:
         """Get list of authors from non-academic institutions."""
-        return [author for author in self.authors if author.is_non_academic]
+        return self._non_academic_authors
+
+    @property
+    def non_academic_names(self) -> FrozenSet[str]:
+        """Get the set of non-academic author names."""
+        return self._non_academic_names
 
     @property
     def company_affiliations(self) -> List[str]:
         """Get unique list of company affiliations."""
-        companies = {
-            author.company_name
-            for author in self.non_academic_authors
-            if author.company_name is not None
-        }
-        return sorted(list(companies))
+        return self._company_affiliations
 
     @property
     def corresponding_author_email(self) -> Optional[str]:
         """Get email of the corresponding author if available."""
-        # First try to find a corresponding author with email
-        for author in self.authors:
-            if author.is_corresponding and author.email:
-                return author.email
-        
-        # If no corresponding author has email, return first author with email
-        for author in self.authors:
-            if author.email:
-                return author.email
-                
-        return None
+        return self._corresponding_author_email
@@ -1,29 +1,75 @@
 """Parser module for PubMed API responses."""
 
 import logging
+import xml.etree.ElementTree as ET
 from datetime import date, datetime
-from typing import Any, Dict, List, Optional
+from typing import IO, Any, Dict, Iterator, List, Optional, Union
 
 from .models import Author, Paper
+from .utils import EMAIL_RE, MONTHS, intern_str
 
 logger = logging.getLogger(__name__)
 
+# Date used when a publication date is missing or unparseable
+_DEFAULT_DATE = date(1900, 1, 1)
+
+
+def _text(element: Optional[ET.Element]) -> str:
+    """Get the full text content of an XML element, including nested markup."""
+    if element is None:
+        return ""
+    return "".join(element.itertext()).strip()
+
 
 class PubMedParser:
     """Parser for PubMed API responses."""
 
     @staticmethod
-    def parse_date(date_str: str) -> date:
-        """Parse date string from PubMed response.
+    def parse_date(date_parts: Union[Dict[str, str], str]) -> date:
+        """Parse a publication date from PubMed response.
 
         Args:
-            date_str: Date string in format YYYY-Mon-DD or YYYY-MM-DD
+            date_parts: Dictionary with "year", "month" and "day" components,
+                or a date string in format YYYY-Mon-DD or YYYY-MM-DD
+
+        Returns:
+            Python date object, with a missing month or day defaulting to 1
+        """
+        if isinstance(date_parts, str):
+            return PubMedParser.parse_iso_date(date_parts)
+
+        year = date_parts.get("year")
+        if not year:
+            return _DEFAULT_DATE
+        month = date_parts.get("month")
+        day = date_parts.get("day")
+        try:
+            return date(
+                int(year),
+                (MONTHS.get(month[:3].lower()) or int(month)) if month else 1,
+                int(day) if day else 1,
+            )
+        except ValueError:
+            logger.warning(f"Could not parse date: {date_parts}")
+            return _DEFAULT_DATE
+
+    @staticmethod
+    def parse_iso_date(date_str: str) -> date:
+        """Parse a date string, taking a fast path for ISO YYYY-MM-DD dates.
+
+        Args:
+            date_str: Date string in format YYYY-MM-DD or YYYY-Mon-DD
 
         Returns:
             Python date object
         """
         try:
-            # Try parsing YYYY-MM-DD format first
+            # date.fromisoformat is implemented in C, unlike strptime
+            return date.fromisoformat(date_str)
+        except ValueError:
+            pass
+        try:
+            # Try parsing YYYY-MM-DD format without zero padding
             return datetime.strptime(date_str, "%Y-%m-%d").date()
         except ValueError:
             try:
@@ -31,7 +77,7 @@ class PubMedParser:
                 return datetime.strptime(date_str, "%Y-%b-%d").date()
             except ValueError:
                 logger.warning(f"Could not parse date string: {date_str}")
-                return date(1900, 1, 1)  # Return default date for unparseable dates
+                return _DEFAULT_DATE  # Return default date for unparseable dates
 
     @staticmethod
     def parse_author(author_data: Dict[str, Any]) -> Author:
@@ -52,38 +98,46 @@ class PubMedParser:
         affiliation = None
         email = None
 
-        # Check for affiliation in AffiliationInfo
-        if "AffiliationInfo" in author_data:
-            affiliations = []
-            for aff_info in author_data["AffiliationInfo"]:
-                if isinstance(aff_info, dict) and "Affiliation" in aff_info:
-                    aff_text = aff_info["Affiliation"].strip()
-                    if aff_text:
-                        affiliations.append(aff_text)
-            if affiliations:
-                affiliation = "; ".join(affiliations)
-
-        # If no AffiliationInfo, check for direct affiliation field
-        if not affiliation:
-            if isinstance(author_data.get("affiliation"), list):
-                affiliations = [aff.strip() for aff in author_data["affiliation"] if aff and aff.strip()]
+        if author_data.get("_email_already_extracted"):
+            # The API layer has already joined the affiliations and removed the
+            # email from them
+            affiliation = author_data.get("affiliation")
+            email = author_data.get("email")
+        else:
+            # Check for affiliation in AffiliationInfo
+            if "AffiliationInfo" in author_data:
+                affiliations = []
+                for aff_info in author_data["AffiliationInfo"]:
+                    if isinstance(aff_info, dict) and "Affiliation" in aff_info:
+                        aff_text = aff_info["Affiliation"].strip()
+                        if aff_text:
+                            affiliations.append(aff_text)
                 if affiliations:
                     affiliation = "; ".join(affiliations)
-            elif isinstance(author_data.get("affiliation"), str):
-                affiliation = author_data["affiliation"].strip()
-
-        # Try to extract email from affiliation if present
-        if affiliation:
-            # Look for email in the affiliation string
-            parts = affiliation.split()
-            for part in parts:
-                if "@" in part and "." in part:  # Basic email validation
-                    email_candidate = part.strip(".,()<>[]{}").lower()
-                    if "@" in email_candidate and "." in email_candidate.split("@")[1]:
-                        email = email_candidate
-                        # Clean up the affiliation by removing the email
-                        affiliation = affiliation.replace(part, "").strip()
-                        break
+
+            # If no AffiliationInfo, check for direct affiliation field
+            if not affiliation:
+                if isinstance(author_data.get("affiliation"), list):
+                    affiliations = [
+                        aff.strip()
+                        for aff in author_data["affiliation"]
+                        if aff and aff.strip()
+                    ]
+                    if affiliations:
+                        affiliation = "; ".join(affiliations)
+                elif isinstance(author_data.get("affiliation"), str):
+                    affiliation = author_data["affiliation"].strip()
+
+            # Try to extract email from affiliation if present
+            if affiliation:
+                # Look for email in the affiliation string
+                match = EMAIL_RE.search(affiliation)
+                if match:
+                    email = match.group(0).lower()
+                    # Clean up the affiliation by removing the email
+                    affiliation = (
+                        affiliation[: match.start()] + affiliation[match.end() :]
+                    ).strip(" ,;.")
 
         # Check if author is corresponding
         is_corresponding = bool(email) or (
@@ -93,11 +147,163 @@ class PubMedParser:
 
         return Author(
             name=name,
-            affiliation=affiliation,
+            affiliation=intern_str(affiliation),
             email=email,
             is_corresponding=is_corresponding,
         )
 
+    @staticmethod
+    def iter_articles(source: Union[str, IO[bytes]]) -> Iterator[ET.Element]:
+        """Stream PubmedArticle elements out of an efetch XML document.
+
+        Each article is cleared once the caller moves on to the next one, so
+        memory use is bounded by a single article rather than the document.
+
+        Args:
+            source: File path or binary file object, such as a streamed
+                response body
+
+        Yields:
+            PubmedArticle XML elements
+
+        Raises:
+            ET.ParseError: If the document is not well-formed XML
+        """
+        for _, article in ET.iterparse(source, events=("end",)):
+            if article.tag != "PubmedArticle":
+                continue
+            try:
+                yield article
+            finally:
+                # Release the article's subtree; the empty shell left in the
+                # root is bounded by the number of articles per response
+                article.clear()
+
+    @staticmethod
+    def _parse_pub_date(pub_date: Optional[ET.Element]) -> date:
+        """Build a date from a PubDate element.
+
+        Args:
+            pub_date: PubDate XML element
+
+        Returns:
+            Publication date, with missing month/day defaulting to 1 and
+            missing or unparseable dates to 1900-01-01
+        """
+        if pub_date is None:
+            return _DEFAULT_DATE
+        return PubMedParser.parse_date(
+            {
+                "year": pub_date.findtext("Year"),
+                "month": pub_date.findtext("Month"),
+                "day": pub_date.findtext("Day"),
+            }
+        )
+
+    @staticmethod
+    def parse_article(article: ET.Element) -> Dict[str, Any]:
+        """Extract paper data from a single PubmedArticle element.
+
+        Args:
+            article: PubmedArticle XML element
+
+        Returns:
+            Dictionary containing paper details
+
+        Raises:
+            ValueError: If the article has no MedlineCitation/Article element
+        """
+        # Walk down to each element with single-tag lookups, which ElementTree
+        # resolves in C; path expressions go through Python-level ElementPath
+        citation = article.find("MedlineCitation")
+        if citation is None:
+            raise ValueError("PubmedArticle has no MedlineCitation")
+        article_info = citation.find("Article")
+        if article_info is None:
+            raise ValueError("MedlineCitation has no Article")
+
+        # Get PMID
+        pmid = _text(citation.find("PMID"))
+
+        # Get title
+        title = _text(article_info.find("ArticleTitle"))
+
+        # Get publication date
+        pub_date = None
+        journal = article_info.find("Journal")
+        if journal is not None:
+            journal_issue = journal.find("JournalIssue")
+            if journal_issue is not None:
+                pub_date = journal_issue.find("PubDate")
+        pubdate = PubMedParser._parse_pub_date(pub_date)
+
+        # Get authors
+        authors = []
+        author_list = article_info.find("AuthorList")
+        for author in author_list if author_list is not None else ():
+            if author.tag != "Author":
+                continue
+            author_data: Dict[str, Any] = {}
+
+            # Get author name
+            last_name = author.findtext("LastName")
+            fore_name = author.findtext("ForeName")
+            if last_name and fore_name:
+                author_data["name"] = f"{fore_name} {last_name}"
+            elif last_name:
+                author_data["name"] = last_name
+            else:
+                continue
+
+            # Get affiliations
+            affiliations = []
+            for aff_info in author:
+                if aff_info.tag != "AffiliationInfo":
+                    continue
+                aff_text = _text(aff_info.find("Affiliation"))
+                if aff_text:
+                    affiliations.append(aff_text)
+
+            # Take the first email found and remove it from its affiliation
+            email = None
+            cleaned = []
+            for aff_text in affiliations:
+                if email is None:
+                    match = EMAIL_RE.search(aff_text)
+                    if match:
+                        email = match.group(0).lower()
+                        aff_text = (
+                            aff_text[: match.start()] + aff_text[match.end() :]
+                        ).strip(" ,;.")
+                cleaned.append(aff_text)
+            affiliations = cleaned
+
+            # Check if author is corresponding
+            is_corresponding = bool(email) or any(
+                "correspond" in aff_text.lower() for aff_text in affiliations
+            )
+
+            author_data["affiliation"] = None
+            if affiliations:
+                author_data["affiliation"] = "; ".join(affiliations)
+            author_data["email"] = email
+            author_data["is_corresponding"] = is_corresponding
+            author_data["_email_already_extracted"] = True
+
+            authors.append(author_data)
+
+        # Get abstract
+        abstract_text = _text(article_info.find("Abstract"))
+
+        # Create paper data dictionary
+        return {
+            "uid": pmid,
+            "title": title,
+            "pubdate_obj": pubdate,
+            "authors": authors,
+            "abstract": abstract_text
+        }
+
     @classmethod
     def parse_paper(cls, paper_data: Dict[str, Any]) -> Optional[Paper]:
         """Parse paper data from PubMed response.
@@ -116,12 +322,15 @@ class PubMedParser:
                 logger.warning(f"Missing required paper data for PMID {pubmed_id}")
                 return None
 
-            # Parse publication date
-            pub_date_str = paper_data.get("pubdate", "")
-            if not pub_date_str:
-                pub_date = date(1900, 1, 1)
-            else:
-                pub_date = cls.parse_date(pub_date_str)
+            # Use the publication date built by the API layer, falling back to
+            # parsing a date string
+            pub_date = paper_data.get("pubdate_obj")
+            if pub_date is None:
+                pub_date_str = paper_data.get("pubdate", "")
+                if not pub_date_str:
+                    pub_date = _DEFAULT_DATE
+                else:
+                    pub_date = cls.parse_date(pub_date_str)
 
             # Parse authors
             authors = []
@@ -1,5 +1,20 @@
 """Utility functions and constants for PubMed paper fetcher."""
 
+import re
+import sys
+from typing import Iterator, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Email addresses embedded in affiliation text
+EMAIL_RE = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+
+# Month numbers keyed by lowercase three-letter abbreviation
+MONTHS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+
 # Academic institution keywords to exclude
 ACADEMIC_KEYWORDS = {
     "university",
@@ -21,6 +36,22 @@ ACADEMIC_KEYWORDS = {
     "institution",
 }
 
+# Generic industry terms, which also name sub-units such as "Drug Safety Unit"
+INDUSTRY_KEYWORDS = {
+    "drug",
+    "health",
+    "solutions",
+    "systems",
+    "products",
+    "group",
+    "holdings",
+    "ventures",
+    "discovery",
+    "development",
+    "research and development",
+    "r&d",
+}
+
 # Pharmaceutical/biotech company keywords to include
 COMPANY_KEYWORDS = {
     # Company types
@@ -56,19 +87,8 @@ COMPANY_KEYWORDS = {
     "plc",
     
     # Industry terms
-    "drug",
-    "health",
-    "solutions",
-    "systems",
-    "products",
-    "group",
-    "holdings",
-    "ventures",
-    "discovery",
-    "development",
-    "research and development",
-    "r&d",
-    
+    *INDUSTRY_KEYWORDS,
+
     # Common company names (without typical endings)
     "pfizer",
     "novartis",
@@ -88,4 +108,35 @@ COMPANY_KEYWORDS = {
     "alexion",
     "celgene",
     "genentech",
-} 
\ No newline at end of file
+} 
+
+
+def chunked(items: List[T], size: int) -> Iterator[List[T]]:
+    """Split a list into consecutive chunks of at most ``size`` items.
+
+    Args:
+        items: List to split
+        size: Maximum number of items per chunk
+
+    Yields:
+        Consecutive slices of ``items``
+    """
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def intern_str(value: Optional[str]) -> Optional[str]:
+    """Return a shared copy of a string so duplicates reference one object.
+
+    Uses the interpreter's intern table, so every module shares one set of
+    copies without keeping its own cache.
+
+    Args:
+        value: String to intern, or None
+
+    Returns:
+        The shared copy of ``value``, or None
+    """
+    if value is None:
+        return None
+    return sys.intern(value)
@@ -1,14 +1,27 @@
 """Tests for the PubMed paper fetcher."""
 
+import io
 from datetime import date
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
+import responses
 
 from pubmed_fetcher.models import Author, Paper
 from pubmed_fetcher.parser import PubMedParser
 
 
+def _streamed_response(body, error=None):
+    """Build a mock streamed response reading ``body``, then raising ``error``."""
+    response = MagicMock()
+    if error is None:
+        response.raw = io.BytesIO(body)
+    else:
+        response.raw.read.side_effect = [body, error]
+    response.__enter__.return_value = response
+    return response
+
+
 def test_author_non_academic_detection():
     """Test detection of non-academic authors."""
     # Academic affiliations
@@ -35,6 +48,35 @@ def test_author_non_academic_detection():
     assert mixed_author.is_non_academic
     assert mixed_author.company == "Novartis Institutes for BioMedical Research"
 
+    # Generic industry terms naming a sub-unit before the company
+    for affiliation, company in [
+        ("Global Drug Development, Novartis Pharma AG, Basel", "Novartis Pharma AG"),
+        ("Drug Safety Unit, Roche, Basel", "Roche"),
+        ("Oncology R&D, AstraZeneca, Cambridge, UK", "AstraZeneca"),
+        ("Computational Biology Group, Sanofi, Paris", "Sanofi"),
+    ]:
+        author = Author(name="Jane Doe", affiliation=affiliation)
+        assert author.is_non_academic
+        assert author.company == company
+
+    # Lowercasing "İ" changes the string length
+    turkish_author = Author(
+        name="Ali Kaya",
+        affiliation="Abdi İbrahim İlaç, Abdi Ibrahim Pharma Inc., Istanbul, Turkey"
+    )
+    assert turkish_author.company == "Abdi Ibrahim Pharma Inc"
+
+
+def test_author_explicit_classification():
+    """Test that explicitly passed classification is not recomputed."""
+    author = Author("Jane Smith", "Pfizer Inc.", None, False, False, None)
+    assert not author.is_non_academic
+    assert author.company is None
+
+    author = Author("Jane Smith", "Acme", None, False, True, "Acme Corp")
+    assert author.is_non_academic
+    assert author.company == "Acme Corp"
+
 
 def test_paper_properties():
     """Test Paper class properties."""
@@ -54,8 +96,7 @@ def test_paper_properties():
     # Test non-academic authors
     non_academic = paper.non_academic_authors
     assert len(non_academic) == 2
-    assert "Jane Smith" in [a.name for a in non_academic]
-    assert "Bob Wilson" in [a.name for a in non_academic]
+    assert paper.non_academic_names == {"Jane Smith", "Bob Wilson"}
     
     # Test company affiliations
     companies = paper.company_affiliations
@@ -67,29 +108,88 @@ def test_paper_properties():
     assert paper.corresponding_author_email == "jane@pfizer.com"
 
 
-@patch('pubmed_fetcher.api.requests.get')
-def test_pubmed_api_search(mock_get):
+def test_csv_export():
+    """Test CSV export of papers."""
+    from pubmed_fetcher.export import CSV_HEADERS, write_csv
+
+    paper = Paper(
+        pubmed_id="12345",
+        title="Test Paper",
+        publication_date=date(2023, 1, 1),
+        authors=[
+            Author("John Doe", "University of Science", None, True, False, None),
+            Author("Jane Smith", "Pfizer Inc.", "jane@pfizer.com", False, True, "Pfizer Inc"),
+        ]
+    )
+
+    output = io.StringIO()
+    write_csv([paper], output)
+
+    lines = output.getvalue().splitlines()
+    assert lines[0] == ",".join(CSV_HEADERS)
+    assert lines[1] == "12345,Test Paper,2023-01-01,Jane Smith,Pfizer Inc,jane@pfizer.com"
+
+
+@responses.activate
+def test_pubmed_api_search():
     """Test PubMed API search functionality."""
     from pubmed_fetcher.api import PubMedAPI
-    
+
     # Mock successful response
-    mock_response = Mock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "esearchresult": {
-            "idlist": ["12345", "67890"]
-        }
-    }
-    mock_get.return_value = mock_response
-    
+    responses.add(
+        responses.GET,
+        "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi",
+        json={
+            "esearchresult": {
+                "idlist": ["12345", "67890"]
+            }
+        },
+        status=200,
+    )
+
     api = PubMedAPI()
     results = api.search("test query")
-    
+
+    request = responses.calls[0].request
+    assert request.params["db"] == "pubmed"
+    assert request.params["term"] == "test query"
+    assert request.params["retmax"] == "100"
     assert len(results) == 2
     assert "12345" in results
     assert "67890" in results
 
 
+@patch('pubmed_fetcher.api.requests.Session.get')
+def test_pubmed_api_stream_search(mock_get):
+    """Test streaming PMIDs out of an XML ESearch response."""
+    from pubmed_fetcher.api import PubMedAPI
+
+    mock_get.return_value = _streamed_response(
+        b"<eSearchResult><Count>2</Count><IdList>"
+        b"<Id>12345</Id><Id>67890</Id></IdList></eSearchResult>"
+    )
+
+    api = PubMedAPI()
+    assert list(api.stream_search("test query")) == ["12345", "67890"]
+
+
+@patch('pubmed_fetcher.api.requests.Session.get')
+def test_pubmed_api_stream_search_connection_drop(mock_get):
+    """Test that a connection dropped mid-stream raises a RequestException."""
+    from requests.exceptions import RequestException
+    from urllib3.exceptions import ProtocolError
+
+    from pubmed_fetcher.api import PubMedAPI
+
+    mock_get.return_value = _streamed_response(
+        b"<eSearchResult><IdList><Id>12345</Id>", ProtocolError("Connection broken")
+    )
+
+    api = PubMedAPI()
+    with pytest.raises(RequestException):
+        list(api.stream_search("test query"))
+
+
 def test_date_parsing():
     """Test date parsing from PubMed response."""
     parser = PubMedParser()
@@ -110,4 +210,191 @@ def test_date_parsing():
     
     # Test invalid date
     invalid_date = parser.parse_date({})
-    assert invalid_date == date(1900, 1, 1)
\ No newline at end of file
+    assert invalid_date == date(1900, 1, 1)
+
+    # Test ISO date string
+    assert parser.parse_iso_date("2023-06-15") == date(2023, 6, 15)
+
+
+SAMPLE_EFETCH_XML = b"""<?xml version="1.0" ?>
+<PubmedArticleSet>
+  <PubmedArticle>
+    <MedlineCitation>
+      <PMID Version="1">12345</PMID>
+      <Article>
+        <Journal>
+          <JournalIssue>
+            <PubDate><Year>2023</Year><Month>Mar</Month><Day>05</Day></PubDate>
+          </JournalIssue>
+        </Journal>
+        <ArticleTitle>A study of <i>in vivo</i> responses</ArticleTitle>
+        <Abstract><AbstractText>Background text.</AbstractText></Abstract>
+        <AuthorList>
+          <Author>
+            <LastName>Smith</LastName>
+            <ForeName>Jane</ForeName>
+            <AffiliationInfo>
+              <Affiliation>Pfizer Inc., New York, USA. jane.smith@pfizer.com.</Affiliation>
+            </AffiliationInfo>
+          </Author>
+          <Author>
+            <LastName>Doe</LastName>
+            <ForeName>John</ForeName>
+            <AffiliationInfo>
+              <Affiliation>University of Science, Boston, USA</Affiliation>
+            </AffiliationInfo>
+          </Author>
+          <Author>
+            <CollectiveName>Study Group</CollectiveName>
+          </Author>
+        </AuthorList>
+      </Article>
+    </MedlineCitation>
+  </PubmedArticle>
+</PubmedArticleSet>
+"""
+
+
+@patch('pubmed_fetcher.api.requests.Session.get')
+def test_pubmed_api_fetch_details(mock_get):
+    """Test parsing of PubMed efetch XML into paper data."""
+    from pubmed_fetcher.api import PubMedAPI
+
+    mock_get.return_value = _streamed_response(SAMPLE_EFETCH_XML)
+
+    api = PubMedAPI()
+    result = api.fetch_details(["12345"])
+
+    paper_data = result["result"]["12345"]
+    assert paper_data["title"] == "A study of in vivo responses"
+    assert paper_data["abstract"] == "Background text."
+    assert len(paper_data["authors"]) == 2
+
+    smith = paper_data["authors"][0]
+    assert smith["name"] == "Jane Smith"
+    assert smith["email"] == "jane.smith@pfizer.com"
+    assert smith["is_corresponding"]
+    assert "@" not in smith["affiliation"]
+
+    paper = PubMedParser.parse_paper(paper_data)
+    assert paper is not None
+    assert paper.publication_date == date(2023, 3, 5)
+    assert paper.corresponding_author_email == "jane.smith@pfizer.com"
+
+
+def test_pubmed_api_rate_limit():
+    """Test that concurrent requests never exceed the rate limit in any second."""
+    import threading
+    import time
+
+    from pubmed_fetcher.api import PubMedAPI
+
+    api = PubMedAPI()
+    timestamps = []
+
+    def acquire():
+        api._acquire()
+        timestamps.append(time.monotonic())
+
+    threads = [
+        threading.Thread(target=acquire) for _ in range(2 * PubMedAPI.RATE_LIMIT)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    timestamps.sort()
+    for start in timestamps:
+        in_window = [t for t in timestamps if start <= t < start + 1]
+        assert len(in_window) <= PubMedAPI.RATE_LIMIT
+
+
+def test_pubmed_api_unusable_cache_dir(tmp_path):
+    """Test that an unusable cache directory disables the cache."""
+    from pubmed_fetcher.api import PubMedAPI
+
+    not_a_dir = tmp_path / "file"
+    not_a_dir.write_text("")
+
+    api = PubMedAPI(cache_dir=str(not_a_dir))
+    assert api.cache is None
+
+
+@patch('pubmed_fetcher.api.requests.Session.get')
+def test_pubmed_api_fetch_details_connection_drop(mock_get):
+    """Test that a connection dropped mid-body fails only that batch."""
+    from urllib3.exceptions import ProtocolError
+
+    from pubmed_fetcher.api import PubMedAPI
+
+    mock_get.return_value = _streamed_response(
+        SAMPLE_EFETCH_XML[:200], ProtocolError("Connection broken")
+    )
+
+    api = PubMedAPI()
+    assert api.fetch_details(["12345"]) == {"result": {}}
+
+
+@patch('pubmed_fetcher.api.requests.Session.get')
+def test_pubmed_api_fetch_details_cache(mock_get, tmp_path):
+    """Test that fetched articles are served from the cache on later calls."""
+    from pubmed_fetcher.api import PubMedAPI
+
+    mock_get.return_value = _streamed_response(SAMPLE_EFETCH_XML)
+
+    api = PubMedAPI(cache_dir=str(tmp_path))
+    first = api.fetch_details(["12345"])
+    assert mock_get.call_count == 1
+
+    second = api.fetch_details(["12345"])
+    assert mock_get.call_count == 1
+    assert second == first
+
+
+def test_article_cache_invalidation(tmp_path):
+    """Test that expired records and records from another layout are dropped."""
+    from pubmed_fetcher.cache import ArticleCache
+
+    record = {"uid": "12345", "pubdate_obj": date(2023, 3, 5), "authors": []}
+
+    cache = ArticleCache(str(tmp_path))
+    cache.put_many([record])
+    assert cache.get_many(["12345"]) == {"12345": record}
+
+    # Expired records are treated as missing
+    with cache._conn:
+        cache._conn.execute("UPDATE articles SET fetched_at = 0")
+    assert cache.get_many(["12345"]) == {}
+    cache.put_many([record])
+
+    # A different record version discards the whole cache
+    with cache._conn:
+        cache._conn.execute("PRAGMA user_version = 0")
+    cache.close()
+    reopened = ArticleCache(str(tmp_path))
+    assert reopened.get_many(["12345"]) == {}
+    reopened.close()
+
+
+@patch('pubmed_fetcher.api.requests.Session.post')
+@patch('pubmed_fetcher.api.requests.Session.get')
+def test_pubmed_api_fetch_details_history(mock_get, mock_post):
+    """Test that large PMID lists are posted once and fetched in pages."""
+    from pubmed_fetcher.api import PubMedAPI
+
+    mock_post.return_value = Mock(
+        content=b"<ePostResult><QueryKey>1</QueryKey><WebEnv>ENV</WebEnv></ePostResult>"
+    )
+    mock_get.return_value = _streamed_response(SAMPLE_EFETCH_XML)
+
+    api = PubMedAPI()
+    pmids = ["12345"] + [str(n) for n in range(1, PubMedAPI.BATCH_SIZE + 1)]
+    result = api.fetch_details(pmids)
+
+    assert mock_post.call_count == 1
+    assert mock_get.call_count == 1
+    params = mock_get.call_args.kwargs["params"]
+    assert params["WebEnv"] == "ENV"
+    assert params["query_key"] == "1"
+    assert list(result["result"]) == ["12345"]